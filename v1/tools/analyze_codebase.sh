@@ -47,13 +47,29 @@ print_section() {
   echo -e "${CYAN}$(printf '%.0s-' {1..50})${NC}"
 }
 
+# Function to print the code smell rows tagged with section $1
+print_smells() {
+  printf '%s\n' "$CODE_SMELLS" | sed -n "s/^$1|//p"
+}
+
+# Function to count the lines across the given files
+count_lines() {
+  cat /dev/null "$@" 2>/dev/null | wc -l
+}
+
+# Collect directories once for the tree map and the summary
+DIRECTORIES=()
+while IFS= read -r -d '' dir; do
+  DIRECTORIES+=("$dir")
+done < <(find "$PROJECT_ROOT" -type d -not -path "*/\.*" -print0 | sort -z)
+
 # 1. Map directory structure
 print_section "Mapping Directory Structure"
 echo "Generating directory tree..."
 {
   echo "# Directory Structure"
   echo '```'
-  find "$PROJECT_ROOT" -type d -not -path "*/\.*" | sort | sed -e "s|$PROJECT_ROOT|.|" -e 's/[^-][^\/]*\//--/g' -e 's/^.\///'
+  printf '%s\n' "${DIRECTORIES[@]}" | sed -e "s|$PROJECT_ROOT|.|" -e 's/[^-][^\/]*\//--/g' -e 's/^.\///'
   echo '```'
 } >"$REPORT_DIR/directory_structure.md"
 echo -e "${GREEN}✓${NC} Directory structure map saved to $REPORT_DIR/directory_structure.md"
@@ -67,27 +83,42 @@ echo "Counting lines by file type..."
   echo "| File Type | Files | Lines | Average |"
   echo "|-----------|-------|-------|---------|"
 
+  # Walk the tree once, sorting files by type; later sections reuse SHELL_FILES
+  SHELL_FILES=()
+  MD_FILES=()
+  CONF_FILES=()
+  OTHER_FILES=()
+  while IFS= read -r -d '' file; do
+    case "$file" in
+    *.sh) SHELL_FILES+=("$file") ;;
+    *.md) MD_FILES+=("$file") ;;
+    *.conf) CONF_FILES+=("$file") ;;
+    */.*) ;;
+    *) OTHER_FILES+=("$file") ;;
+    esac
+  done < <(find "$PROJECT_ROOT" -type f -print0 | sort -z)
+
   # Count for shell scripts
-  shell_files=$(find "$PROJECT_ROOT" -name "*.sh" -type f | wc -l)
-  shell_lines=$(find "$PROJECT_ROOT" -name "*.sh" -type f -exec wc -l {} \; | awk '{total += $1} END {print total}')
+  shell_files=${#SHELL_FILES[@]}
+  shell_lines=$(count_lines "${SHELL_FILES[@]}")
   shell_avg=$((shell_lines / shell_files))
   echo "| Shell Scripts (.sh) | $shell_files | $shell_lines | $shell_avg |"
 
   # Count for markdown files
-  md_files=$(find "$PROJECT_ROOT" -name "*.md" -type f | wc -l)
-  md_lines=$(find "$PROJECT_ROOT" -name "*.md" -type f -exec wc -l {} \; | awk '{total += $1} END {print total}')
+  md_files=${#MD_FILES[@]}
+  md_lines=$(count_lines "${MD_FILES[@]}")
   md_avg=$((md_lines / md_files))
   echo "| Documentation (.md) | $md_files | $md_lines | $md_avg |"
 
   # Count for configuration files
-  conf_files=$(find "$PROJECT_ROOT" -name "*.conf" -type f | wc -l)
-  conf_lines=$(find "$PROJECT_ROOT" -name "*.conf" -type f -exec wc -l {} \; | awk '{total += $1} END {print total}')
+  conf_files=${#CONF_FILES[@]}
+  conf_lines=$(count_lines "${CONF_FILES[@]}")
   conf_avg=$((conf_lines / conf_files))
   echo "| Configuration (.conf) | $conf_files | $conf_lines | $conf_avg |"
 
   # Count for other files
-  other_files=$(find "$PROJECT_ROOT" -type f -not -path "*/\.*" -not -name "*.sh" -not -name "*.md" -not -name "*.conf" | wc -l)
-  other_lines=$(find "$PROJECT_ROOT" -type f -not -path "*/\.*" -not -name "*.sh" -not -name "*.md" -not -name "*.conf" -exec wc -l {} \; 2>/dev/null | awk '{total += $1} END {print total}')
+  other_files=${#OTHER_FILES[@]}
+  other_lines=$(count_lines "${OTHER_FILES[@]}")
   other_avg=$((other_lines / other_files))
   echo "| Other Files | $other_files | $other_lines | $other_avg |"
 
@@ -110,9 +141,9 @@ echo "Mapping source statements between files..."
   echo "| File | Dependencies |"
   echo "|------|--------------|"
 
-  find "$PROJECT_ROOT" -name "*.sh" -type f | sort | while read -r file; do
-    rel_file=$(echo "$file" | sed "s|$PROJECT_ROOT/||")
-    deps=$(grep -E "^\s*source" "$file" | sed 's/source\s*//' | tr -d '"' | tr -d "'" | sed 's/\$[A-Za-z_][A-Za-z0-9_]*\///' | sed 's/\$([^)]*)//g' | sort | uniq | tr '\n' ',' | sed 's/,$//')
+  for file in "${SHELL_FILES[@]}"; do
+    rel_file=${file#"$PROJECT_ROOT"/}
+    deps=$(LC_ALL=C grep -E "^\s*source" "$file" | sed -e 's/source\s*//' -e "s/[\"']//g" -e 's/\$[A-Za-z_][A-Za-z0-9_]*\///' -e 's/\$([^)]*)//g' | sort | uniq | tr '\n' ',' | sed 's/,$//')
     echo "| $rel_file | $deps |"
   done
 } >"$REPORT_DIR/module_dependencies.md"
@@ -122,6 +153,25 @@ echo -e "${GREEN}✓${NC} Module dependencies saved to $REPORT_DIR/module_depend
 print_section "Identifying Potential Code Smells"
 echo "Scanning for potential issues..."
 {
+  # One awk pass over every shell script gathers the rows for all four
+  # sections; each row is tagged with its section and split out below.
+  # The final line is the source statement tally used by the summary.
+  # The patterns are plain ASCII, so scan bytes in the C locale.
+  CODE_SMELLS=$(LC_ALL=C awk -v root="$PROJECT_ROOT/" '
+    function flush_globals() {
+      if (rel_file != "" && globals > 5) printf "globals|| %s | %d |\n", rel_file, globals
+    }
+    FNR == 1 {flush_globals(); name=""; hardcoded=0; unchecked=0; globals=0; rel_file=substr(FILENAME, length(root) + 1)}
+    /^[a-zA-Z0-9_]+\(\)/ {name=$1; start=FNR}
+    /^}/ {if (name && FNR-start > 50) printf "long|| %s | %s | %d |\n", rel_file, name, FNR-start; name=""}
+    /(threshold|interval|timeout|retries|max_|min_)[[:space:]]*=[[:space:]]*[0-9]+/ && hardcoded++ < 5 {printf "hardcoded|| %s | %d | %s |\n", rel_file, FNR, $0}
+    /^[A-Z_]+=.+/ {globals++}
+    /command [^|&;]+ [^|&;]+$/ && unchecked++ < 5 {printf "unchecked|| %s | %d | Command without error check: `%s` |\n", rel_file, FNR, $0}
+    /source / {sources++}
+    END {flush_globals(); printf "%d\n", sources}' /dev/null "${SHELL_FILES[@]}")
+  SOURCE_COUNT=${CODE_SMELLS##*$'\n'}
+  CODE_SMELLS=${CODE_SMELLS%"$SOURCE_COUNT"}
+
   echo "# Potential Code Smells"
   echo ""
   echo "## Long Functions"
@@ -130,10 +180,7 @@ echo "Scanning for potential issues..."
   echo "| File | Function | Lines |"
   echo "|------|----------|-------|"
 
-  find "$PROJECT_ROOT" -name "*.sh" -type f | sort | while read -r file; do
-    rel_file=$(echo "$file" | sed "s|$PROJECT_ROOT/||")
-    awk '/^[a-zA-Z0-9_]+\(\)/ {name=$1; start=NR} /^}/ {if (name && NR-start > 50) printf "| %s | %s | %d |\n", "'"$rel_file"'", name, NR-start; name=""}' "$file"
-  done
+  print_smells long
 
   echo ""
   echo "## Hardcoded Values"
@@ -142,12 +189,7 @@ echo "Scanning for potential issues..."
   echo "| File | Line | Content |"
   echo "|------|------|---------|"
 
-  find "$PROJECT_ROOT" -name "*.sh" -type f | sort | while read -r file; do
-    rel_file=$(echo "$file" | sed "s|$PROJECT_ROOT/||")
-    grep -n -E '(threshold|interval|timeout|retries|max_|min_)[[:space:]]*=[[:space:]]*[0-9]+' "$file" | head -5 | while IFS=: read -r line_num line_content; do
-      echo "| $rel_file | $line_num | $line_content |"
-    done
-  done
+  print_smells hardcoded
 
   echo ""
   echo "## Global Variables"
@@ -156,13 +198,7 @@ echo "Scanning for potential issues..."
   echo "| File | Global Variables Count |"
   echo "|------|------------------------|"
 
-  find "$PROJECT_ROOT" -name "*.sh" -type f | sort | while read -r file; do
-    rel_file=$(echo "$file" | sed "s|$PROJECT_ROOT/||")
-    count=$(grep -E '^[A-Z_]+=.+' "$file" | wc -l)
-    if [ "$count" -gt 5 ]; then
-      echo "| $rel_file | $count |"
-    fi
-  done
+  print_smells globals
 
   echo ""
   echo "## Error Handling"
@@ -171,12 +207,7 @@ echo "Scanning for potential issues..."
   echo "| File | Line | Issue |"
   echo "|------|------|-------|"
 
-  find "$PROJECT_ROOT" -name "*.sh" -type f | sort | while read -r file; do
-    rel_file=$(echo "$file" | sed "s|$PROJECT_ROOT/||")
-    grep -n -E 'command [^|&;]+ [^|&;]+$' "$file" | head -5 | while IFS=: read -r line_num line_content; do
-      echo "| $rel_file | $line_num | Command without error check: \`$line_content\` |"
-    done
-  done
+  print_smells unchecked
 } >"$REPORT_DIR/code_smells.md"
 echo -e "${GREEN}✓${NC} Code smell analysis saved to $REPORT_DIR/code_smells.md"
 
@@ -196,8 +227,8 @@ print_section "Generating Summary Report"
   echo ""
   echo "## Key Findings"
   echo ""
-  echo "1. **Directory Structure**: The project has $(find "$PROJECT_ROOT" -type d -not -path "*/\.*" | wc -l) directories."
-  echo "2. **Module Dependencies**: Found $(grep -r "source " "$PROJECT_ROOT" --include="*.sh" | wc -l) source statements across the codebase."
+  echo "1. **Directory Structure**: The project has ${#DIRECTORIES[@]} directories."
+  echo "2. **Module Dependencies**: Found $SOURCE_COUNT source statements across the codebase."
   echo "3. **Code Smells**: Identified potentially long functions, hardcoded values, and error handling issues."
   echo ""
   echo "## Recommendations for v2 Refactoring"